@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 import pandas as pd
 
 from app.api.deps import get_db
+from app.core.responses import DefaultJSONResponse
 from app.models.configuracion import Configuracion
 from app.models.montecarlo import MonteCarloExperiment
 from app.schemas.montecarlo import (
@@ -17,7 +18,7 @@ from app.schemas.montecarlo import (
     MonteCarloExperimentDetail,
     MonteCarloProgress,
 )
-from app.services.montecarlo_service import ejecutar_experimento_montecarlo
+from app.services.montecarlo_service import config_desde_parametros, ejecutar_experimento_montecarlo
 from app.services.anova_service import calcular_anova_dos_vias, formatear_resultados_anova
 
 router = APIRouter()
@@ -486,8 +487,18 @@ def get_experiment_replicas(
             detail=f"El experimento debe estar completado. Estado actual: {experiment.estado}",
         )
 
-    # Obtener réplicas completadas
-    replicas = db.query(MonteCarloReplica).filter(
+    # Obtener réplicas completadas: solo las columnas de la respuesta, sin
+    # materializar objetos ORM completos por réplica
+    replicas = db.query(
+        MonteCarloReplica.id,
+        MonteCarloReplica.nivel_servicio_pct,
+        MonteCarloReplica.dias_con_quiebre,
+        MonteCarloReplica.inventario_promedio_tm,
+        MonteCarloReplica.autonomia_promedio_dias,
+        MonteCarloReplica.probabilidad_quiebre_stock_pct,
+        MonteCarloReplica.demanda_insatisfecha_tm,
+        MonteCarloReplica.disrupciones_totales,
+    ).filter(
         MonteCarloReplica.experiment_id == experiment_id,
         MonteCarloReplica.estado == "completed"
     ).all()
@@ -545,8 +556,9 @@ def get_experiment_series_temporales(
     Returns:
         Series temporales agregadas con estadísticas por día
     """
+    from dataclasses import replace
+
     import numpy as np
-    from bll.config import SimulationConfig
     from bll.simulation import run_simulation
 
     experiment = db.query(MonteCarloExperiment).filter(
@@ -571,89 +583,77 @@ def get_experiment_series_temporales(
         )
 
     params = config.parametros
-    cap = params.get("capacidad_hub_tm", 431.0)
-    inv_pct = params.get("inventario_inicial_pct", 60.0)
-    seed_base = params.get("semilla_aleatoria") or 42
-    sim_days = params.get("duracion_simulacion_dias", 365)
+    base_config = config_desde_parametros(params)
+    seed_base = base_config.seed
+    sim_days = base_config.simulation_days
 
     # Ejecutar múltiples réplicas y recolectar series temporales
     all_series = []
 
     for i in range(num_muestras):
-        sim_config = SimulationConfig(
-            capacity_tm=cap,
-            reorder_point_tm=params.get("punto_reorden_tm", cap * 0.7),
-            order_quantity_tm=params.get("cantidad_pedido_tm", cap * 0.5),
-            initial_inventory_tm=cap * inv_pct / 100.0,
-            base_daily_demand_tm=params.get("demanda_base_diaria_tm", 52.5),
-            nominal_lead_time_days=params.get("lead_time_nominal_dias", 6.0),
-            disruption_min_days=params.get("duracion_disrupcion_min_dias", 3.0),
-            disruption_mode_days=params.get("duracion_disrupcion_mode_dias", 7.0),
-            disruption_max_days=params.get("duracion_disrupcion_max_dias", 21.0),
-            annual_disruption_rate=params.get("tasa_disrupciones_anual", 4.0),
-            use_seasonality=params.get("usar_estacionalidad", True),
-            simulation_days=sim_days,
-            seed=seed_base * 100000 + i + 1000000,  # Semillas diferentes
-        )
+        sim_config = replace(base_config, seed=seed_base * 100000 + i + 1000000)  # Semillas diferentes
 
         result = run_simulation(sim_config)
         all_series.append(result["time_series"])
 
-    # Agregar por día
-    series_agregadas = []
-
-    for day in range(sim_days):
-        day_data = {
-            "inventario": [],
-            "demanda": [],
-            "demanda_satisfecha": [],
-            "dias_autonomia": [],
-            "quiebre_stock": [],
-            "ruta_bloqueada": [],
-        }
-
-        for series in all_series:
-            if day < len(series):
-                row = series[day]
-                day_data["inventario"].append(row["inventory"])
-                day_data["demanda"].append(row["demand"])
-                day_data["demanda_satisfecha"].append(row["satisfied_demand"])
-                day_data["dias_autonomia"].append(row["autonomy_days"])
-                day_data["quiebre_stock"].append(1 if row["stockout"] else 0)
-                day_data["ruta_bloqueada"].append(1 if row["route_blocked"] else 0)
-
-        # Calcular estadísticas
-        inv = np.array(day_data["inventario"])
-        dem = np.array(day_data["demanda"])
-        dem_sat = np.array(day_data["demanda_satisfecha"])
-        aut = np.array(day_data["dias_autonomia"])
-
-        series_agregadas.append({
+    # Agregar por día: una matriz (campo, réplica, día) y estadísticos por eje,
+    # en lugar de listas por día. Días faltantes quedan como NaN.
+    campos = ("inventory", "demand", "satisfied_demand", "autonomy_days", "stockout", "route_blocked")
+    matriz = np.full((len(campos), num_muestras, sim_days), np.nan)
+    for i, series in enumerate(all_series):
+        n = min(len(series), sim_days)
+        if n:
+            matriz[:, i, :n] = np.array(
+                [[row[c] for c in campos] for row in series[:n]], dtype=float
+            ).T
+
+    completo = all(len(series) >= sim_days for series in all_series)
+    media = np.mean if completo else np.nanmean
+    desv = np.std if completo else np.nanstd
+    percentil = np.percentile if completo else np.nanpercentile
+
+    inv, dem, dem_sat, aut, quiebre, bloqueo = matriz
+    inv_mean = media(inv, axis=0).tolist()
+    inv_std = desv(inv, axis=0).tolist()
+    inv_p5, inv_p25, inv_p50, inv_p75, inv_p95 = percentil(inv, [5, 25, 50, 75, 95], axis=0).tolist()
+    dem_mean = media(dem, axis=0).tolist()
+    dem_sat_mean = media(dem_sat, axis=0).tolist()
+    aut_mean = media(aut, axis=0).tolist()
+    aut_p5, aut_p95 = percentil(aut, [5, 95], axis=0).tolist()
+    prob_quiebre = (media(quiebre, axis=0) * 100).tolist()
+    prob_bloqueo = (media(bloqueo, axis=0) * 100).tolist()
+
+    series_agregadas = [
+        {
             "dia": day,
             # Inventario
-            "inventario_mean": float(np.mean(inv)),
-            "inventario_std": float(np.std(inv)),
-            "inventario_p5": float(np.percentile(inv, 5)),
-            "inventario_p25": float(np.percentile(inv, 25)),
-            "inventario_p50": float(np.percentile(inv, 50)),
-            "inventario_p75": float(np.percentile(inv, 75)),
-            "inventario_p95": float(np.percentile(inv, 95)),
+            "inventario_mean": inv_mean[day],
+            "inventario_std": inv_std[day],
+            "inventario_p5": inv_p5[day],
+            "inventario_p25": inv_p25[day],
+            "inventario_p50": inv_p50[day],
+            "inventario_p75": inv_p75[day],
+            "inventario_p95": inv_p95[day],
             # Demanda
-            "demanda_mean": float(np.mean(dem)),
-            "demanda_satisfecha_mean": float(np.mean(dem_sat)),
+            "demanda_mean": dem_mean[day],
+            "demanda_satisfecha_mean": dem_sat_mean[day],
             # Autonomía
-            "dias_autonomia_mean": float(np.mean(aut)),
-            "dias_autonomia_p5": float(np.percentile(aut, 5)),
-            "dias_autonomia_p95": float(np.percentile(aut, 95)),
+            "dias_autonomia_mean": aut_mean[day],
+            "dias_autonomia_p5": aut_p5[day],
+            "dias_autonomia_p95": aut_p95[day],
             # Probabilidades
-            "prob_quiebre_stock": float(np.mean(day_data["quiebre_stock"])) * 100,
-            "prob_ruta_bloqueada": float(np.mean(day_data["ruta_bloqueada"])) * 100,
-        })
+            "prob_quiebre_stock": prob_quiebre[day],
+            "prob_ruta_bloqueada": prob_bloqueo[day],
+        }
+        for day in range(sim_days)
+    ]
 
-    return {
+    # Serie ya compuesta por floats nativos: se responde sin pasar por
+    # jsonable_encoder, que recorrería cada punto de cada día.
+    return DefaultJSONResponse({
         "experiment_id": experiment_id,
         "experiment_nombre": experiment.nombre,
         "num_muestras": num_muestras,
         "dias_simulados": sim_days,
         "series_temporales": series_agregadas,
-    }
+    })
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.core.responses import DefaultJSONResponse
 from app.schemas.resultado import ResultadoResponse
 from app.schemas.simulacion import SimulacionRequest, SimulacionResponse
 from app.services import simulacion_service
@@ -131,11 +132,12 @@ async def get_series_temporales(
         # Re-ejecutar con los mismos parámetros
         resultado = await simulacion_service.ejecutar_modelo(config_db.parametros)
 
-        # Retornar solo las series temporales
-        return {
+        # Retornar solo las series temporales. Los puntos vienen de la BLL ya
+        # tipados; se responden directo sin revalidar/recodificar cada uno.
+        return DefaultJSONResponse({
             "simulacion_id": simulacion_id,
             "series_temporales": resultado.get("series_temporales", [])
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
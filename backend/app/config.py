@@ -23,6 +23,9 @@ class Settings(BaseSettings):
 
     # Simulación
     max_workers: int = 11
+    # Pool compartido de simulaciones individuales; convive con los pools de
+    # cada experimento Monte Carlo (hasta 16 workers), por eso es pequeño.
+    simulation_pool_workers: int = 2
     default_replicas: int = 1000
 
     model_config = SettingsConfigDict(
@@ -0,0 +1,33 @@
+"""Respuesta JSON para endpoints que devuelven dicts grandes sin response_model.
+
+Usa orjson cuando está instalado (serialización en C, soporta NumPy y
+convierte NaN en null); si no, cae al JSONResponse estándar. No se usa como
+default_response_class: las rutas con response_model serializan mejor por la
+vía directa Pydantic → JSON de FastAPI.
+"""
+
+from fastapi.responses import JSONResponse
+
+__all__ = ["DefaultJSONResponse"]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    # Se hereda de JSONResponse y no de ORJSONResponse: esta última está
+    # deprecada en FastAPI >= 0.12x (FastAPIDeprecationWarning), aunque siga
+    # disponible en la 0.109.2 fijada en requirements.txt.
+    class DefaultJSONResponse(JSONResponse):
+        """JSONResponse serializada con orjson, incluidos escalares y arrays NumPy."""
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+
+else:
+    DefaultJSONResponse = JSONResponse
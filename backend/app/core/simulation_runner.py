@@ -1,6 +1,8 @@
 import asyncio
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,36 @@ if str(_root_dir) not in sys.path:
 from bll.config import SimulationConfig
 from bll.simulation import run_simulation
 
+from app.config import get_settings
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    # La simulación es CPU-bound: en un thread retendría el GIL y frenaría el
+    # event loop. El pool se crea una vez y se reutiliza entre requests.
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=get_settings().simulation_pool_workers)
+    return _process_pool
+
+
+def _reset_process_pool(broken: ProcessPoolExecutor) -> None:
+    # Solo se descarta si sigue siendo el pool roto: otra request concurrente
+    # puede haberlo reemplazado ya por uno sano.
+    global _process_pool
+    if _process_pool is broken:
+        _process_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool() -> None:
+    """Cierra el pool de simulaciones (llamado al apagar la aplicación)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+
 
 async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
     loop = asyncio.get_event_loop()
@@ -39,7 +71,14 @@ async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
     )
 
     start = time.time()
-    result = await loop.run_in_executor(None, run_simulation, config)
+    pool = _get_process_pool()
+    try:
+        result = await loop.run_in_executor(pool, run_simulation, config)
+    except BrokenProcessPool:
+        # Un worker murió (OOM, fallo nativo): el pool queda inutilizable.
+        # Se descarta, se crea uno nuevo y se reintenta una sola vez.
+        _reset_process_pool(pool)
+        result = await loop.run_in_executor(_get_process_pool(), run_simulation, config)
     duration = time.time() - start
 
     kpis = {
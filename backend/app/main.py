@@ -7,6 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.config import get_settings
+from app.core.simulation_runner import shutdown_process_pool
 from app.db.init_db import init_db
 
 settings = get_settings()
@@ -19,7 +20,7 @@ async def lifespan(app: FastAPI):
     init_db()
     yield
     # Shutdown
-    pass
+    shutdown_process_pool()
 
 
 app = FastAPI(
@@ -13,9 +13,6 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 from scipy import stats
-from statsmodels.formula.api import ols
-from statsmodels.stats.anova import anova_lm
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
 
 
 @dataclass
@@ -72,16 +69,23 @@ def calcular_anova_dos_vias(
         >>> resultado = calcular_anova_dos_vias(df)
         >>> print(resultado.tabla_anova)
     """
+    # statsmodels se importa aquí: cargarlo al iniciar la API cuesta ~1 s
+    from statsmodels.formula.api import ols
+    from statsmodels.stats.anova import anova_lm
+    from statsmodels.stats.multicomp import pairwise_tukeyhsd
+
     # Validar datos
     required_cols = [variable_respuesta, factor_1, factor_2]
     missing = set(required_cols) - set(data.columns)
     if missing:
         raise ValueError(f"Columnas faltantes: {missing}")
 
-    # Asegurar que los factores son categóricos
-    data = data.copy()
-    data[factor_1] = data[factor_1].astype('category')
-    data[factor_2] = data[factor_2].astype('category')
+    # Asegurar que los factores son categóricos (solo se copian las columnas usadas)
+    data = pd.DataFrame({
+        variable_respuesta: data[variable_respuesta],
+        factor_1: data[factor_1].astype('category'),
+        factor_2: data[factor_2].astype('category'),
+    })
 
     # Modelo ANOVA de dos vías con interacción (Tipo II)
     formula = f"{variable_respuesta} ~ C({factor_1}) + C({factor_2}) + C({factor_1}):C({factor_2})"
@@ -127,10 +131,8 @@ def calcular_anova_dos_vias(
             groups=data[factor_1],
             alpha=0.05
         )
-        tukey_capacidad = pd.DataFrame(
-            data=tukey_cap.summary().data[1:],
-            columns=tukey_cap.summary().data[0]
-        )
+        tabla_tukey = tukey_cap.summary().data
+        tukey_capacidad = pd.DataFrame(data=tabla_tukey[1:], columns=tabla_tukey[0])
 
     if len(data[factor_2].unique()) > 1:
         tukey_dur = pairwise_tukeyhsd(
@@ -138,17 +140,18 @@ def calcular_anova_dos_vias(
             groups=data[factor_2],
             alpha=0.05
         )
-        tukey_duracion = pd.DataFrame(
-            data=tukey_dur.summary().data[1:],
-            columns=tukey_dur.summary().data[0]
-        )
+        tabla_tukey = tukey_dur.summary().data
+        tukey_duracion = pd.DataFrame(data=tabla_tukey[1:], columns=tabla_tukey[0])
 
     # Medias por configuración
-    medias_por_configuracion = data.groupby([factor_1, factor_2])[variable_respuesta].agg([
-        'mean', 'std', 'count',
-        ('ci_lower', lambda x: x.mean() - 1.96 * x.std() / np.sqrt(len(x))),
-        ('ci_upper', lambda x: x.mean() + 1.96 * x.std() / np.sqrt(len(x)))
-    ]).reset_index()
+    # IC al 95% derivado de las columnas agregadas, sin lambdas por grupo
+    medias_por_configuracion = data.groupby(
+        [factor_1, factor_2], observed=True
+    )[variable_respuesta].agg(['mean', 'std', 'count'])
+    margen = 1.96 * medias_por_configuracion['std'] / np.sqrt(medias_por_configuracion['count'])
+    medias_por_configuracion['ci_lower'] = medias_por_configuracion['mean'] - margen
+    medias_por_configuracion['ci_upper'] = medias_por_configuracion['mean'] + margen
+    medias_por_configuracion = medias_por_configuracion.reset_index()
 
     # Renombrar columnas para mejor legibilidad
     tabla_anova_clean = tabla_anova.copy()
@@ -2,6 +2,7 @@ import sys
 import time
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
@@ -20,36 +21,48 @@ from app.models.montecarlo import MonteCarloExperiment, MonteCarloReplica
 from app.models.simulacion import Simulacion
 
 
-def _run_replica(config_params: dict, replica_num: int) -> dict[str, Any]:
+@dataclass(slots=True)
+class ReplicaResult:
+    replica_numero: int
+    estado: str
+    kpis: dict[str, Any] | None
+    duracion_segundos: float
+    error_mensaje: str | None = None
+
+
+def config_desde_parametros(params: dict) -> SimulationConfig:
+    """Traduce los parámetros de una Configuracion a SimulationConfig (semilla base)."""
+    cap = params.get("capacidad_hub_tm", 431.0)
+    inv_pct = params.get("inventario_inicial_pct", 60.0)
+
+    return SimulationConfig(
+        capacity_tm=cap,
+        reorder_point_tm=params.get("punto_reorden_tm", cap * 0.7),
+        order_quantity_tm=params.get("cantidad_pedido_tm", cap * 0.5),
+        initial_inventory_tm=cap * inv_pct / 100.0,
+        base_daily_demand_tm=params.get("demanda_base_diaria_tm", 52.5),
+        nominal_lead_time_days=params.get("lead_time_nominal_dias", 6.0),
+        disruption_min_days=params.get("duracion_disrupcion_min_dias", 3.0),
+        disruption_mode_days=params.get("duracion_disrupcion_mode_dias", 7.0),
+        disruption_max_days=params.get("duracion_disrupcion_max_dias", 21.0),
+        annual_disruption_rate=params.get("tasa_disrupciones_anual", 4.0),
+        use_seasonality=params.get("usar_estacionalidad", True),
+        simulation_days=params.get("duracion_simulacion_dias", 365),
+        seed=params.get("semilla_aleatoria") or 42,
+    )
+
+
+def _run_replica(base_config: SimulationConfig, replica_num: int) -> ReplicaResult:
     start = time.time()
     try:
-        cap = config_params.get("capacidad_hub_tm", 431.0)
-        inv_pct = config_params.get("inventario_inicial_pct", 60.0)
-        seed_base = config_params.get("semilla_aleatoria") or 42
-
-        config = SimulationConfig(
-            capacity_tm=cap,
-            reorder_point_tm=config_params.get("punto_reorden_tm", cap * 0.7),
-            order_quantity_tm=config_params.get("cantidad_pedido_tm", cap * 0.5),
-            initial_inventory_tm=cap * inv_pct / 100.0,
-            base_daily_demand_tm=config_params.get("demanda_base_diaria_tm", 52.5),
-            nominal_lead_time_days=config_params.get("lead_time_nominal_dias", 6.0),
-            disruption_min_days=config_params.get("duracion_disrupcion_min_dias", 3.0),
-            disruption_mode_days=config_params.get("duracion_disrupcion_mode_dias", 7.0),
-            disruption_max_days=config_params.get("duracion_disrupcion_max_dias", 21.0),
-            annual_disruption_rate=config_params.get("tasa_disrupciones_anual", 4.0),
-            use_seasonality=config_params.get("usar_estacionalidad", True),
-            simulation_days=config_params.get("duracion_simulacion_dias", 365),
-            seed=seed_base * 100000 + replica_num,
-        )
-
+        config = replace(base_config, seed=base_config.seed * 100000 + replica_num)
         result = run_simulation(config)
         del result["time_series"]
 
-        return {
-            "replica_numero": replica_num,
-            "estado": "completed",
-            "kpis": {
+        return ReplicaResult(
+            replica_numero=replica_num,
+            estado="completed",
+            kpis={
                 "nivel_servicio_pct": result["service_level_pct"],
                 "probabilidad_quiebre_stock_pct": result["stockout_probability_pct"],
                 "dias_con_quiebre": result["stockout_days"],
@@ -59,17 +72,16 @@ def _run_replica(config_params: dict, replica_num: int) -> dict[str, Any]:
                 "demanda_insatisfecha_tm": result["unsatisfied_demand_tm"],
                 "disrupciones_totales": result["total_disruptions"],
             },
-            "duracion_segundos": time.time() - start,
-            "error_mensaje": None,
-        }
+            duracion_segundos=time.time() - start,
+        )
     except Exception as e:
-        return {
-            "replica_numero": replica_num,
-            "estado": "failed",
-            "kpis": None,
-            "duracion_segundos": time.time() - start,
-            "error_mensaje": str(e),
-        }
+        return ReplicaResult(
+            replica_numero=replica_num,
+            estado="failed",
+            kpis=None,
+            duracion_segundos=time.time() - start,
+            error_mensaje=str(e),
+        )
 
 
 def calcular_estadisticas_agregadas(replicas: list[MonteCarloReplica]) -> dict[str, float]:
@@ -78,7 +90,8 @@ def calcular_estadisticas_agregadas(replicas: list[MonteCarloReplica]) -> dict[s
         return {}
 
     def arr(attr):
-        return np.array([getattr(r, attr) for r in completed if getattr(r, attr) is not None])
+        values = (getattr(r, attr) for r in completed)
+        return np.fromiter((v for v in values if v is not None), dtype=float)
 
     ns = arr("nivel_servicio_pct")
     pq = arr("probabilidad_quiebre_stock_pct")
@@ -89,34 +102,39 @@ def calcular_estadisticas_agregadas(replicas: list[MonteCarloReplica]) -> dict[s
     di = arr("demanda_insatisfecha_tm")
     dr = arr("disrupciones_totales")
 
+    # Un solo np.percentile por KPI (una ordenación) en vez de uno por percentil
+    ns_p25, ns_p50, ns_p75, ns_p95 = np.percentile(ns, [25, 50, 75, 95])
+    pq_p50, pq_p95 = np.percentile(pq, [50, 95])
+    dq_p50, dq_p95 = np.percentile(dq, [50, 95])
+
     return {
-        "nivel_servicio_mean": float(np.mean(ns)),
-        "nivel_servicio_std": float(np.std(ns)),
-        "nivel_servicio_min": float(np.min(ns)),
-        "nivel_servicio_max": float(np.max(ns)),
-        "nivel_servicio_p25": float(np.percentile(ns, 25)),
-        "nivel_servicio_p50": float(np.percentile(ns, 50)),
-        "nivel_servicio_p75": float(np.percentile(ns, 75)),
-        "nivel_servicio_p95": float(np.percentile(ns, 95)),
-        "probabilidad_quiebre_stock_mean": float(np.mean(pq)),
-        "probabilidad_quiebre_stock_std": float(np.std(pq)),
-        "probabilidad_quiebre_stock_p50": float(np.percentile(pq, 50)),
-        "probabilidad_quiebre_stock_p95": float(np.percentile(pq, 95)),
-        "dias_con_quiebre_mean": float(np.mean(dq)),
-        "dias_con_quiebre_std": float(np.std(dq)),
-        "dias_con_quiebre_p50": float(np.percentile(dq, 50)),
-        "dias_con_quiebre_p95": float(np.percentile(dq, 95)),
-        "inventario_promedio_mean": float(np.mean(ip)),
-        "inventario_promedio_std": float(np.std(ip)),
-        "inventario_minimo_mean": float(np.mean(im)),
-        "inventario_minimo_std": float(np.std(im)),
-        "autonomia_promedio_mean": float(np.mean(au)),
-        "autonomia_promedio_std": float(np.std(au)),
-        "autonomia_promedio_p50": float(np.percentile(au, 50)),
-        "demanda_insatisfecha_mean": float(np.mean(di)),
-        "demanda_insatisfecha_std": float(np.std(di)),
-        "disrupciones_totales_mean": float(np.mean(dr)),
-        "disrupciones_totales_std": float(np.std(dr)),
+        "nivel_servicio_mean": float(ns.mean()),
+        "nivel_servicio_std": float(ns.std()),
+        "nivel_servicio_min": float(ns.min()),
+        "nivel_servicio_max": float(ns.max()),
+        "nivel_servicio_p25": float(ns_p25),
+        "nivel_servicio_p50": float(ns_p50),
+        "nivel_servicio_p75": float(ns_p75),
+        "nivel_servicio_p95": float(ns_p95),
+        "probabilidad_quiebre_stock_mean": float(pq.mean()),
+        "probabilidad_quiebre_stock_std": float(pq.std()),
+        "probabilidad_quiebre_stock_p50": float(pq_p50),
+        "probabilidad_quiebre_stock_p95": float(pq_p95),
+        "dias_con_quiebre_mean": float(dq.mean()),
+        "dias_con_quiebre_std": float(dq.std()),
+        "dias_con_quiebre_p50": float(dq_p50),
+        "dias_con_quiebre_p95": float(dq_p95),
+        "inventario_promedio_mean": float(ip.mean()),
+        "inventario_promedio_std": float(ip.std()),
+        "inventario_minimo_mean": float(im.mean()),
+        "inventario_minimo_std": float(im.std()),
+        "autonomia_promedio_mean": float(au.mean()),
+        "autonomia_promedio_std": float(au.std()),
+        "autonomia_promedio_p50": float(np.median(au)),
+        "demanda_insatisfecha_mean": float(di.mean()),
+        "demanda_insatisfecha_std": float(di.std()),
+        "disrupciones_totales_mean": float(dr.mean()),
+        "disrupciones_totales_std": float(dr.std()),
     }
 
 
@@ -142,28 +160,34 @@ def ejecutar_experimento_montecarlo(experiment_id: int) -> MonteCarloExperiment:
 
         start_total = time.time()
         params = config.parametros
+        # La configuración se arma una vez; cada réplica solo cambia la semilla
+        base_config = config_desde_parametros(params)
         results = []
 
         with ProcessPoolExecutor(max_workers=exp.max_workers) as executor:
-            futures = {executor.submit(_run_replica, params, i): i for i in range(1, exp.num_replicas + 1)}
+            futures = {executor.submit(_run_replica, base_config, i): i for i in range(1, exp.num_replicas + 1)}
             done = 0
+            total = exp.num_replicas
             for future in as_completed(futures):
                 results.append(future.result())
                 done += 1
-                exp.progreso = int(done / exp.num_replicas * 100)
-                db.commit()
+                # Solo se escribe en la BD cuando cambia el porcentaje entero
+                progreso = int(done / total * 100)
+                if progreso != exp.progreso:
+                    exp.progreso = progreso
+                    db.commit()
 
         for res in results:
             replica = MonteCarloReplica(
                 experiment_id=exp.id,
-                replica_numero=res["replica_numero"],
-                estado=res["estado"],
+                replica_numero=res.replica_numero,
+                estado=res.estado,
                 ejecutada_en=datetime.utcnow(),
-                duracion_segundos=res["duracion_segundos"],
-                error_mensaje=res.get("error_mensaje"),
+                duracion_segundos=res.duracion_segundos,
+                error_mensaje=res.error_mensaje,
             )
-            if res["estado"] == "completed" and res["kpis"]:
-                kpis = res["kpis"]
+            if res.estado == "completed" and res.kpis:
+                kpis = res.kpis
                 replica.nivel_servicio_pct = kpis["nivel_servicio_pct"]
                 replica.probabilidad_quiebre_stock_pct = kpis["probabilidad_quiebre_stock_pct"]
                 replica.dias_con_quiebre = kpis["dias_con_quiebre"]
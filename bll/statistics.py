@@ -1,4 +1,5 @@
 from __future__ import annotations
+import importlib.util
 from dataclasses import dataclass
 from typing import Any
 
@@ -6,13 +7,8 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-try:
-    import statsmodels.api as sm
-    from statsmodels.formula.api import ols
-    from statsmodels.stats.multicomp import pairwise_tukeyhsd
-    HAS_STATSMODELS = True
-except ImportError:
-    HAS_STATSMODELS = False
+# statsmodels solo se importa dentro de anova_two_way (carga patsy y tarda ~1 s)
+HAS_STATSMODELS = importlib.util.find_spec("statsmodels") is not None
 
 
 @dataclass
@@ -35,6 +31,10 @@ def anova_two_way(
     if not HAS_STATSMODELS:
         raise ImportError("statsmodels required for ANOVA")
 
+    import statsmodels.api as sm
+    from statsmodels.formula.api import ols
+    from statsmodels.stats.multicomp import pairwise_tukeyhsd
+
     formula = f"{response} ~ C({factor1}) + C({factor2}) + C({factor1}):C({factor2})"
     model = ols(formula, data=df).fit()
     anova_table = sm.stats.anova_lm(model, typ=2)
@@ -48,10 +48,10 @@ def anova_two_way(
 
     main_effects = {}
     for factor in [factor1, factor2]:
-        means = df.groupby(factor)[response].mean()
+        means = df.groupby(factor, observed=True)[response].mean()
         main_effects[factor] = means.max() - means.min()
 
-    interaction_means = df.groupby([factor1, factor2])[response].mean()
+    interaction_means = df.groupby([factor1, factor2], observed=True)[response].mean()
     interaction_effect = interaction_means.std()
 
     tukey1 = pairwise_tukeyhsd(df[response], df[factor1])
@@ -68,34 +68,46 @@ def anova_two_way(
     )
 
 
+def _group_mean_std(
+    codes: np.ndarray,
+    values: np.ndarray,
+    size: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Conteo, media y desviación (ddof=1) por grupo con np.bincount."""
+    n = np.bincount(codes, minlength=size)
+    mean = np.bincount(codes, weights=values, minlength=size) / n
+    sq_dev = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(sq_dev / (n - 1))
+    return n, mean, std
+
+
 def confidence_intervals(
     df: pd.DataFrame,
     group_col: str = "config_name",
     value_col: str = "service_level_pct",
     alpha: float = 0.05
 ) -> pd.DataFrame:
-    results = []
-    for name, group in df.groupby(group_col):
-        values = group[value_col].values
-        n = len(values)
-        mean = np.mean(values)
-        std = np.std(values, ddof=1)
-        se = std / np.sqrt(n)
-        t_crit = stats.t.ppf(1 - alpha / 2, n - 1)
-        margin = t_crit * se
-
-        results.append({
-            "config": name,
-            "n": n,
-            "mean": round(mean, 4),
-            "std": round(std, 4),
-            "se": round(se, 4),
-            "ci_lower": round(mean - margin, 4),
-            "ci_upper": round(mean + margin, 4),
-            "margin": round(margin, 4),
-        })
-
-    return pd.DataFrame(results)
+    codes, uniques = pd.factorize(df[group_col], sort=True)
+    valid = codes >= 0
+    codes = codes[valid]
+    values = df[value_col].to_numpy(dtype=float)[valid]
+
+    n, mean, std = _group_mean_std(codes, values, len(uniques))
+    se = std / np.sqrt(n)
+    t_crit = stats.t.ppf(1 - alpha / 2, n - 1)
+    margin = t_crit * se
+
+    return pd.DataFrame({
+        "config": np.asarray(uniques),
+        "n": n.astype(int),
+        "mean": np.round(mean, 4),
+        "std": np.round(std, 4),
+        "se": np.round(se, 4),
+        "ci_lower": np.round(mean - margin, 4),
+        "ci_upper": np.round(mean + margin, 4),
+        "margin": np.round(margin, 4),
+    })
 
 
 def descriptive_statistics(
@@ -112,18 +124,27 @@ def descriptive_statistics(
         ]
 
     agg_funcs = ["count", "mean", "std", "min", "max"]
-    stats_df = df.groupby(group_col)[metrics].agg(agg_funcs)
+    stats_df = df.groupby(group_col, observed=True)[metrics].agg(agg_funcs)
     stats_df.columns = ["_".join(col).strip() for col in stats_df.columns.values]
 
     return stats_df.round(4)
 
 
 def parse_config_name(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["capacity"] = df["config_name"].apply(
-        lambda x: "StatusQuo" if x.startswith("SQ") else "Proposed"
-    )
-    df["disruption"] = df["config_name"].apply(
-        lambda x: x.split("_")[1] if "_" in x else "Unknown"
+    """Agrega los factores capacity/disruption como categóricos.
+
+    config_name se factoriza una sola vez; las funciones de este módulo
+    agrupan con observed=True sobre los códigos en vez de hashear strings.
+    Retorna un frame nuevo sin modificar df; con copy-on-write de pandas,
+    assign no copia las columnas existentes.
+    """
+    config = df["config_name"].astype("category")
+    return df.assign(
+        config_name=config,
+        capacity=config.map(
+            lambda x: "StatusQuo" if x.startswith("SQ") else "Proposed"
+        ).astype("category"),
+        disruption=config.map(
+            lambda x: x.split("_")[1] if "_" in x else "Unknown"
+        ).astype("category"),
     )
-    return df
@@ -1,10 +1,11 @@
 """Data Access Layer - Persistence and Export."""
 from .checkpoint import CheckpointManager
-from .export import export_csv, export_json, generate_latex_table
+from .export import export_csv, export_json, export_parquet, generate_latex_table
 
 __all__ = [
     "CheckpointManager",
     "export_csv",
     "export_json",
+    "export_parquet",
     "generate_latex_table",
 ]
@@ -1,7 +1,16 @@
 from __future__ import annotations
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+ZSTD_LEVEL = 3
 
 
 class CheckpointManager:
@@ -17,36 +26,103 @@ class CheckpointManager:
         if not self.exists():
             return 0, []
 
-        with open(self.data_path, "r") as f:
-            data = json.load(f)
+        config_id = self._last_config_id()
+        results: list[dict] = []
+        extend = results.extend
+        for _, batch in self.iter_load():
+            extend(batch)
 
-        config_id = data.get("last_config_id", 0)
-        results = []
+        return config_id, results
+
+    def iter_load(self) -> Iterator[tuple[int, list[dict]]]:
+        """Entrega (config_id, batch) uno a uno sin retener todos los batches en memoria."""
+        if not self.exists():
+            return
 
-        for batch_file in sorted(self.results_path.glob("batch_*.json")):
-            with open(batch_file, "r") as f:
-                batch = json.load(f)
-                results.extend(batch)
+        config_id = self._last_config_id()
+        for batch_path in self._batch_files():
+            yield config_id, self._read_batch(batch_path)
 
-        return config_id, results
+    @staticmethod
+    def _read_batch(batch_path: str) -> list[dict]:
+        with open(batch_path, "rb") as f:
+            raw = f.read()
+        if batch_path.endswith(".zst"):
+            if not HAS_ZSTD:
+                raise ImportError(f"zstandard required to read compressed checkpoint batch {batch_path}")
+            raw = zstd.ZstdDecompressor().decompress(raw)
+        return json.loads(raw)
+
+    def _last_config_id(self) -> int:
+        with open(self.data_path, "r") as f:
+            data = json.load(f)
+        return data.get("last_config_id", 0)
+
+    def _batch_files(self) -> list[str]:
+        """Rutas de los batches ordenadas por número, sin construir objetos Path."""
+        if not self.results_path.exists():
+            return []
+        with os.scandir(self.results_path) as it:
+            entries = [
+                e for e in it
+                if e.name.startswith("batch_") and e.name.endswith((".json", ".json.zst"))
+            ]
+        entries.sort(key=lambda e: int(e.name[6:].split(".", 1)[0]))
+        return [e.path for e in entries]
 
     def save(self, config_id: int, batch: list[dict], batch_num: int):
         self.path.mkdir(parents=True, exist_ok=True)
         self.results_path.mkdir(exist_ok=True)
 
-        with open(self.data_path, "w") as f:
-            json.dump({"last_config_id": config_id}, f)
+        # El batch se escribe (y sincroniza) antes que la metadata: checkpoint.json
+        # nunca apunta a un config_id cuyos resultados no estén en disco, incluso
+        # ante un corte de energía.
+        payload = json.dumps(batch).encode()
+        if HAS_ZSTD:
+            batch_file = self.results_path / f"batch_{batch_num:06d}.json.zst"
+            payload = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).compress(payload)
+        else:
+            batch_file = self.results_path / f"batch_{batch_num:06d}.json"
+        _atomic_write(batch_file, payload)
 
-        batch_file = self.results_path / f"batch_{batch_num:06d}.json"
-        with open(batch_file, "w") as f:
-            json.dump(batch, f)
+        meta = json.dumps({"last_config_id": config_id}).encode()
+        _atomic_write(self.data_path, meta)
 
     def clear(self):
         if self.results_path.exists():
-            for f in self.results_path.glob("batch_*.json"):
+            for f in self.results_path.glob("batch_*.json*"):
                 f.unlink()
             self.results_path.rmdir()
         if self.data_path.exists():
             self.data_path.unlink()
         if self.path.exists() and not any(self.path.iterdir()):
             self.path.rmdir()
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Escribe en un .tmp sincronizado y lo renombra; un corte a mitad no deja archivos truncados."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(path: Path):
+    """Persiste el rename en el directorio; no soportado en Windows, donde se omite."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -1,16 +1,59 @@
 from __future__ import annotations
+import datetime
 import json
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
-def export_csv(df: pd.DataFrame, path: Path, index: bool = False):
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def export_csv(df: pd.DataFrame, path: Path, index: bool = False, engine: str = "pandas"):
+    """Exporta df a CSV.
+
+    engine="pyarrow" usa el escritor columnar de Arrow, más rápido en tablas
+    grandes pero con otro formato: textos y encabezados siempre entre comillas,
+    booleanos true/false, fechas con microsegundos y floats en notación de Arrow.
+    """
     Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if engine == "pyarrow":
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow required for engine='pyarrow'")
+        table = pa.Table.from_pandas(df, preserve_index=index)
+        if index:
+            # from_pandas deja el índice al final; se mueve al inicio con el nombre que usa to_csv
+            n = df.index.nlevels
+            data_cols = table.column_names[:-n]
+            index_names = ["" if name is None else str(name) for name in df.index.names]
+            table = table.select(table.column_names[-n:] + data_cols).rename_columns(index_names + data_cols)
+        pa_csv.write_csv(table, path, pa_csv.WriteOptions(quoting_style="needed"))
+        return
     df.to_csv(path, index=index)
 
 
+def export_parquet(df: pd.DataFrame, path: Path, index: bool = False):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if HAS_PYARROW:
+        table = pa.Table.from_pandas(df, preserve_index=index)
+        pq.write_table(table, path)
+        return
+    df.to_parquet(path, index=index)
+
+
 def export_json(data: dict[str, Any], path: Path, indent: int = 2):
     Path(path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -23,16 +66,91 @@ def export_json(data: dict[str, Any], path: Path, indent: int = 2):
             return {k: convert(v) for k, v in obj.__dict__.items()}
         return obj
 
+    if HAS_ORJSON:
+        # orjson serializa arrays/escalares NumPy y dataclasses sin recorrerlos en Python.
+        # Fechas y escalares pandas se escriben con str(), igual que default=str.
+        def default(obj):
+            if obj is pd.NA or isinstance(obj, (datetime.date, datetime.time, datetime.timedelta, pd.Period)):
+                return str(obj)
+            converted = convert(obj)
+            return str(obj) if converted is obj or converted == {} else converted
+
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent == 2:
+            options |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, default=default, option=options)
+        if indent not in (None, 2):
+            # orjson solo indenta a 2 espacios; otros valores se re-indentan sin cambiar el contenido
+            payload = json.dumps(json.loads(payload), indent=indent).encode()
+        with open(path, "wb") as f:
+            f.write(payload)
+        return
+
     with open(path, "w") as f:
         json.dump(convert(data), f, indent=indent, default=str)
 
 
+def _format_column(values: np.ndarray) -> np.ndarray | None:
+    """Celdas tal como las escribe to_latex(float_format="%.4f"); None si el tipo no está cubierto."""
+    if values.dtype.kind == "f":
+        formatted = np.char.mod("%.4f", values)
+        return np.where(np.isnan(values), "NaN", formatted)
+    if values.dtype.kind in "iu":
+        return values.astype(str)
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) == "string":
+        return np.where(pd.isna(values), "NaN", values.astype(str))
+    return None
+
+
+def _latex_tabular(df: pd.DataFrame) -> str:
+    """Equivalente a df.to_latex(index=True, float_format="%.4f", escape=False).
+
+    Formatea por columna con NumPy para índices simples y columnas numéricas
+    o de texto; cualquier otro caso (MultiIndex, índice float, categóricas,
+    bool, enteros nullable) se delega a to_latex.
+    """
+    if (
+        df.empty
+        or isinstance(df.index, pd.MultiIndex)
+        or isinstance(df.columns, pd.MultiIndex)
+        or df.columns.name is not None
+        or df.index.dtype.kind == "f"
+    ):
+        return df.to_latex(index=True, float_format="%.4f", escape=False)
+
+    columns = [_format_column(df.index.to_numpy())]
+    align = "l"
+    for dtype, col in zip(df.dtypes, (df.iloc[:, i] for i in range(df.shape[1]))):
+        if not isinstance(dtype, (np.dtype, pd.StringDtype)):
+            columns.append(None)
+            break
+        columns.append(_format_column(col.to_numpy()))
+        align += "r" if dtype.kind in "fiu" else "l"
+    if any(col is None for col in columns):
+        return df.to_latex(index=True, float_format="%.4f", escape=False)
+
+    body = [" & ".join(row) + " \\\\" for row in zip(*columns)]
+
+    lines = [
+        f"\\begin{{tabular}}{{{align}}}",
+        "\\toprule",
+        " & " + " & ".join(str(c) for c in df.columns) + " \\\\",
+    ]
+    if df.index.name is not None:
+        lines.append(" & ".join([str(df.index.name)] + [""] * len(df.columns)) + " \\\\")
+    lines.append("\\midrule")
+    lines.extend(body)
+    lines.append("\\bottomrule")
+    lines.append("\\end{tabular}")
+    return "\n".join(lines) + "\n"
+
+
 def generate_latex_table(
     df: pd.DataFrame,
     caption: str = "Results",
     label: str = "tab:results"
 ) -> str:
-    latex = df.to_latex(index=True, float_format="%.4f", escape=False)
+    latex = _latex_tabular(df)
 
     full = f"""\\begin{{table}}[htbp]
 \\centering
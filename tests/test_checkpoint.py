@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from dal import checkpoint
+from dal.checkpoint import CheckpointManager
+
+
+@pytest.fixture
+def manager(tmp_path) -> CheckpointManager:
+    return CheckpointManager(tmp_path / "ckpt")
+
+
+def test_load_without_checkpoint(manager):
+    assert manager.load() == (0, [])
+    assert list(manager.iter_load()) == []
+
+
+def test_batches_load_in_numeric_order(manager, monkeypatch):
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", False)
+    # batch_1000000 supera el padding de 6 dígitos: por nombre quedaría antes de batch_200000
+    for batch_num in (1000000, 200000, 2):
+        manager.save(batch_num, [{"batch": batch_num}], batch_num)
+
+    config_id, results = manager.load()
+
+    assert config_id == 2
+    assert [r["batch"] for r in results] == [2, 200000, 1000000]
+
+
+def test_mixed_json_and_zst_batches(manager, monkeypatch):
+    pytest.importorskip("zstandard")
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", False)
+    manager.save(0, [{"i": 0}], 0)
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", True)
+    manager.save(1, [{"i": 1}], 1)
+
+    names = sorted(p.name for p in manager.results_path.iterdir())
+    assert names == ["batch_000000.json", "batch_000001.json.zst"]
+    assert manager.load() == (1, [{"i": 0}, {"i": 1}])
+
+
+def test_zst_batch_without_zstandard_raises(manager, monkeypatch):
+    pytest.importorskip("zstandard")
+    manager.save(0, [{"i": 0}], 0)
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", False)
+
+    with pytest.raises(ImportError, match="batch_000000.json.zst"):
+        manager.load()
+
+
+def test_temp_files_are_ignored(manager, monkeypatch):
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", False)
+    manager.save(0, [{"i": 0}], 0)
+    (manager.results_path / "batch_000001.json.tmp").write_text("{truncado")
+
+    assert manager.load() == (0, [{"i": 0}])
+
+
+def test_iter_load_matches_load(manager, monkeypatch):
+    monkeypatch.setattr(checkpoint, "HAS_ZSTD", False)
+    for batch_num in range(3):
+        manager.save(batch_num, [{"i": batch_num}, {"i": batch_num + 10}], batch_num)
+
+    batches = list(manager.iter_load())
+    config_id, results = manager.load()
+
+    assert [cid for cid, _ in batches] == [config_id] * 3
+    assert [row for _, batch in batches for row in batch] == results
+    assert json.loads(manager.data_path.read_text()) == {"last_config_id": config_id}
@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bll.statistics import confidence_intervals, descriptive_statistics, parse_config_name
+from dal.export import _latex_tabular, export_json
+
+
+@pytest.fixture
+def results() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    configs = ["SQ_Short", "SQ_Long", "PR_Short", "PR_Long"]
+    n = 10
+    df = pd.DataFrame({
+        "config_name": np.repeat(configs, n),
+        "service_level_pct": rng.uniform(80, 100, len(configs) * n),
+        "stockout_probability_pct": rng.uniform(0, 20, len(configs) * n),
+        "avg_autonomy_days": rng.uniform(2, 10, len(configs) * n),
+        "avg_inventory_tm": rng.uniform(100, 400, len(configs) * n),
+    })
+    df.loc[0, "avg_inventory_tm"] = np.nan
+    return parse_config_name(df)
+
+
+def _to_latex(df: pd.DataFrame) -> str:
+    return df.to_latex(index=True, float_format="%.4f", escape=False)
+
+
+def test_latex_tabular_descriptive_statistics(results):
+    df = descriptive_statistics(results)
+    assert _latex_tabular(df) == _to_latex(df)
+
+
+def test_latex_tabular_confidence_intervals(results):
+    df = confidence_intervals(results)
+    assert _latex_tabular(df) == _to_latex(df)
+
+
+def test_latex_tabular_multiindex(results):
+    df = results.groupby(["capacity", "disruption"], observed=True)[["service_level_pct"]].mean()
+    assert _latex_tabular(df) == _to_latex(df)
+
+
+def test_latex_tabular_missing_text_and_float_index():
+    df = pd.DataFrame({"s": ["x", None], "f": [0.5, np.nan]}, index=[0.5, 1.5])
+    assert _latex_tabular(df) == _to_latex(df)
+
+
+@pytest.mark.parametrize("indent", [2, 4])
+def test_export_json_keeps_timestamps_and_numpy(tmp_path, indent):
+    path = tmp_path / "out.json"
+    export_json({
+        "g": pd.Timestamp("2024-01-01"),
+        "arr": np.arange(3),
+        "df": pd.DataFrame({"d": pd.to_datetime(["2024-01-02"])}),
+    }, path, indent=indent)
+
+    data = json.loads(path.read_text())
+    assert data["g"] == "2024-01-01 00:00:00"
+    assert data["arr"] == [0, 1, 2]
+    assert data["df"] == [{"d": "2024-01-02 00:00:00"}]
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+from scipy import stats
+
+from bll.statistics import confidence_intervals, parse_config_name
+
+
+def test_parse_config_name_does_not_mutate_input():
+    df = pd.DataFrame({
+        "config_name": ["SQ_Short", "PR_Long", "Other"],
+        "service_level_pct": [90.0, 95.0, 99.0],
+    })
+    original = df.copy()
+
+    parsed = parse_config_name(df)
+
+    tm.assert_frame_equal(df, original)
+    assert isinstance(parsed["config_name"].dtype, pd.CategoricalDtype)
+    assert parsed["capacity"].tolist() == ["StatusQuo", "Proposed", "Proposed"]
+    assert parsed["disruption"].tolist() == ["Short", "Long", "Unknown"]
+    np.testing.assert_array_equal(parsed["service_level_pct"], original["service_level_pct"])
+
+
+def _reference_confidence_intervals(df, group_col, value_col, alpha=0.05):
+    grouped = df.groupby(group_col)[value_col]
+    ref = grouped.agg(
+        n="size",
+        mean=lambda v: np.mean(v.to_numpy()),
+        std=lambda v: np.std(v.to_numpy(), ddof=1) if len(v) > 1 else np.nan,
+    ).reset_index(names="config")
+    se = ref["std"] / np.sqrt(ref["n"])
+    margin = stats.t.ppf(1 - alpha / 2, ref["n"] - 1) * se
+    return pd.DataFrame({
+        "config": ref["config"].to_numpy(dtype=object),
+        "n": ref["n"].astype(int),
+        "mean": ref["mean"].round(4),
+        "std": ref["std"].round(4),
+        "se": se.round(4),
+        "ci_lower": (ref["mean"] - margin).round(4),
+        "ci_upper": (ref["mean"] + margin).round(4),
+        "margin": margin.round(4),
+    })
+
+
+def test_confidence_intervals_matches_groupby_reference():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "config_name": ["SQ_Long", "PR_Short", "SQ_Short"] * 20 + ["PR_Long", None, "SQ_NaN"],
+        "service_level_pct": np.append(rng.uniform(70, 100, 62), [np.nan]),
+    })
+
+    result = confidence_intervals(df)
+    expected = _reference_confidence_intervals(df, "config_name", "service_level_pct")
+
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+    assert result.loc[result["config"] == "SQ_NaN", "mean"].isna().all()
+    assert result.loc[result["config"] == "PR_Long", "n"].item() == 1